@@ -1017,7 +1017,7 @@ class FHIRStructureDefinition:
         if not self._did_finalize:
             raise Exception("Cannot use `needed_external_classes` before finalizing")
 
-        internal = set([c.name for c in self.classes])
+        internal = {c.name for c in self.classes}
         needed = set()
         needs = []
 
@@ -45,18 +45,14 @@ def fhir_model_validator(
     model_name: str, v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
     """ """
-    if typing.TYPE_CHECKING:
-        model_class: typing.Union[
-            typing.Type[BaseModel], typing.Type[FHIRAbstractModel]
-        ]
-    model_class = get_fhir_model_class(model_name)
+    model_class: typing.Union[
+        typing.Type[BaseModel], typing.Type[FHIRAbstractModel]
+    ] = get_fhir_model_class(model_name)
 
     if isinstance(v, (str, bytes)):
         try:
             v = model_class.parse_raw(v)
         except ValidationError as exc:
-            if typing.TYPE_CHECKING:
-                model_class = typing.cast(typing.Type[BaseModel], model_class)
             errors = exc.errors()
             if (
                 len(errors) == 1